@@ -4,7 +4,25 @@ Handles environment variables and default settings
 """
 
 import os
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
+
+
+@lru_cache(maxsize=4)
+def _build_cors_origins(frontend_host: str, frontend_port: int, additional_origins: str) -> Tuple[str, ...]:
+    """Build the CORS origin list once per distinct configuration"""
+    origins = [
+        f"http://{frontend_host}:{frontend_port}",
+        f"http://127.0.0.1:{frontend_port}",
+        f"http://localhost:{frontend_port}"
+    ]
+    
+    # Add additional origins from environment variable
+    if additional_origins:
+        origins.extend([origin.strip() for origin in additional_origins.split(",")])
+    
+    return tuple(dict.fromkeys(origins))  # Remove duplicates, keep order
+
 
 class Config:
     """Application configuration class"""
@@ -12,6 +30,9 @@ class Config:
     # Backend server configuration
     BACKEND_HOST: str = os.getenv("BACKEND_HOST", "0.0.0.0")
     BACKEND_PORT: int = int(os.getenv("BACKEND_PORT", "8000"))
+    # Uvicorn worker processes; more than one lets concurrent reports use
+    # several CPU cores for JSON encoding and issue processing
+    BACKEND_WORKERS: int = int(os.getenv("BACKEND_WORKERS", "1"))
     
     # Frontend configuration
     FRONTEND_HOST: str = os.getenv("FRONTEND_HOST", "localhost")
@@ -21,18 +42,11 @@ class Config:
     @property
     def CORS_ORIGINS(self) -> List[str]:
         """Get CORS origins based on frontend configuration"""
-        origins = [
-            f"http://{self.FRONTEND_HOST}:{self.FRONTEND_PORT}",
-            f"http://127.0.0.1:{self.FRONTEND_PORT}",
-            f"http://localhost:{self.FRONTEND_PORT}"
-        ]
-        
-        # Add additional origins from environment variable
-        additional_origins = os.getenv("CORS_ORIGINS", "")
-        if additional_origins:
-            origins.extend([origin.strip() for origin in additional_origins.split(",")])
-        
-        return list(set(origins))  # Remove duplicates
+        return list(_build_cors_origins(
+            self.FRONTEND_HOST,
+            self.FRONTEND_PORT,
+            os.getenv("CORS_ORIGINS", "")
+        ))
     
     # API configuration
     API_TITLE: str = os.getenv("API_TITLE", "Jira Status Automation API")
@@ -42,6 +56,20 @@ class Config:
     # Request timeout settings
     REQUEST_TIMEOUT: int = int(os.getenv("REQUEST_TIMEOUT", "120"))  # 2 minutes default
     
+    # Jira connection settings; the connect timeout is kept short so an
+    # unreachable host fails fast while slow responses keep REQUEST_TIMEOUT.
+    # Retries apply to report calls only, not to the initial connection check
+    JIRA_CONNECT_TIMEOUT: float = float(os.getenv("JIRA_CONNECT_TIMEOUT", "5"))
+    JIRA_MAX_RETRIES: int = int(os.getenv("JIRA_MAX_RETRIES", "3"))
+    
+    # Number of issues whose comments/changelog are fetched from Jira in parallel
+    REPORT_WORKERS: int = int(os.getenv("REPORT_WORKERS", "8"))
+    
+    # Response compression: bodies smaller than GZIP_MIN_SIZE bytes are sent
+    # as-is; level 6 gets most of level 9's ratio for far less CPU per report
+    GZIP_MIN_SIZE: int = int(os.getenv("GZIP_MIN_SIZE", "500"))
+    GZIP_LEVEL: int = int(os.getenv("GZIP_LEVEL", "6"))
+    
     # Logging configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     
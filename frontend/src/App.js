@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef, useCallback } from 'react';
 import ConfigurationForm from './components/ConfigurationForm';
 import JiraReportsTable from './components/JiraReportsTable';
 import JiraAnalytics from './components/JiraAnalytics';
@@ -7,6 +7,25 @@ import RecentReports from './components/RecentReports';
 import LoadingSpinner from './components/LoadingSpinner';
 import Alert from './components/Alert';
 
+const RECENT_REPORTS_KEY = 'jiraRecentReports';
+
+/**
+ * Read saved recent reports once, as the initial state, instead of rendering
+ * an empty list first and loading them in an effect
+ * @returns {Array} - Saved reports, or an empty list
+ */
+const loadSavedReports = () => {
+  const savedReports = localStorage.getItem(RECENT_REPORTS_KEY);
+  if (savedReports) {
+    try {
+      return JSON.parse(savedReports);
+    } catch (err) {
+      console.error('Failed to parse saved reports:', err);
+    }
+  }
+  return [];
+};
+
 /**
  * Main Application Component - Dashboard Style
  * 
@@ -25,28 +44,43 @@ function App() {
 
   // Application state
   const [currentReport, setCurrentReport] = useState(null);
-  const [recentReports, setRecentReports] = useState([]);
+  const [recentReports, setRecentReports] = useState(loadSavedReports);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState(null);
   const [success, setSuccess] = useState(null);
 
-  // Load recent reports from localStorage on component mount
+  // How long the current success message stays visible (ms)
+  const successDurationRef = useRef(5000);
+
+  // Auto-dismiss success messages with a single timer that is cleared when
+  // the message changes or the app unmounts, so stale timers never pile up
+  // or clear a newer message early
   useEffect(() => {
-    const savedReports = localStorage.getItem('jiraRecentReports');
-    if (savedReports) {
-      try {
-        setRecentReports(JSON.parse(savedReports));
-      } catch (err) {
-        console.error('Failed to parse saved reports:', err);
-      }
-    }
-  }, []);
+    if (!success) return undefined;
+    const timer = setTimeout(() => setSuccess(null), successDurationRef.current);
+    return () => clearTimeout(timer);
+  }, [success]);
 
-  // Save recent reports to localStorage whenever they change
+  /**
+   * Show a success message that dismisses itself
+   * @param {string} message - Message to display
+   * @param {number} duration - Display time in milliseconds
+   */
+  const showSuccess = (message, duration) => {
+    successDurationRef.current = duration;
+    setSuccess(message);
+  };
+
+  // Save recent reports to localStorage whenever they change. The first run
+  // is skipped since the state was just read from there, and an empty list
+  // is saved too so deleting the last report sticks across reloads.
+  const skipInitialSaveRef = useRef(true);
   useEffect(() => {
-    if (recentReports.length > 0) {
-      localStorage.setItem('jiraRecentReports', JSON.stringify(recentReports));
+    if (skipInitialSaveRef.current) {
+      skipInitialSaveRef.current = false;
+      return;
     }
+    localStorage.setItem(RECENT_REPORTS_KEY, JSON.stringify(recentReports));
   }, [recentReports]);
 
   /**
@@ -82,8 +116,7 @@ function App() {
       return updated;
     });
 
-    setSuccess(`Successfully generated report with ${reportData.length} issues`);
-    setTimeout(() => setSuccess(null), 5000);
+    showSuccess(`Successfully generated report with ${reportData.length} issues`, 5000);
   };
 
   /**
@@ -111,11 +144,13 @@ function App() {
   /**
    * Clear current results and reset
    */
-  const clearCurrentReport = () => {
+  // Stable identity so the memoized report table does not re-render on
+  // every loading or alert change in App
+  const clearCurrentReport = useCallback(() => {
     setCurrentReport(null);
     setError(null);
     setSuccess(null);
-  };
+  }, []);
 
   /**
    * Load a report from recent reports
@@ -130,8 +165,7 @@ function App() {
       startDate: report.dateRange.split(' to ')[0],
       endDate: report.dateRange.split(' to ')[1]
     });
-    setSuccess(`Loaded report: ${report.projectKey} (${report.issueCount} issues)`);
-    setTimeout(() => setSuccess(null), 3000);
+    showSuccess(`Loaded report: ${report.projectKey} (${report.issueCount} issues)`, 3000);
   };
 
   /**
@@ -1,7 +1,38 @@
 import React, { useState, useEffect } from 'react';
-import axios from 'axios';
 import { format } from 'date-fns';
-import { getApiUrl } from '../config';
+import { apiClient } from '../config';
+import { isValidUrl, isValidProjectKey, MAX_RANGE_DAYS, MS_PER_DAY } from '../validation';
+
+// Connection fields, rendered and required-checked from one table
+const TEXT_FIELDS = [
+  {
+    id: 'jiraUrl',
+    label: 'Jira URL',
+    type: 'text',
+    placeholder: 'https://your-company.atlassian.net',
+    hint: 'Your Jira instance URL (e.g., https://company.atlassian.net)',
+    requiredMessage: 'Jira URL is required'
+  },
+  {
+    id: 'personalAccessToken',
+    label: 'Personal Access Token',
+    type: 'password',
+    placeholder: 'Your Jira API token',
+    hint: 'Generate in Jira: Profile → Security → API tokens',
+    requiredMessage: 'Personal Access Token is required'
+  },
+  {
+    id: 'projectKey',
+    label: 'Project Key',
+    type: 'text',
+    placeholder: 'PROJ',
+    hint: 'Found in project settings or issue URLs (e.g., PROJ in PROJ-123)',
+    requiredMessage: 'Project Key is required',
+    style: { textTransform: 'uppercase' }
+  }
+];
+
+const ERROR_INPUT_CLASS = 'border-red-300 focus:border-red-500 focus:ring-red-500';
 
 /**
  * ConfigurationForm Component
@@ -56,19 +87,17 @@ const ConfigurationForm = ({
   const validateForm = () => {
     const errors = {};
 
-    if (!formData.jiraUrl.trim()) {
-      errors.jiraUrl = 'Jira URL is required';
-    } else if (!isValidUrl(formData.jiraUrl)) {
-      errors.jiraUrl = 'Please enter a valid URL';
-    }
+    TEXT_FIELDS.forEach(({ id, requiredMessage }) => {
+      if (!formData[id].trim()) {
+        errors[id] = requiredMessage;
+      }
+    });
 
-    if (!formData.personalAccessToken.trim()) {
-      errors.personalAccessToken = 'Personal Access Token is required';
+    if (!errors.jiraUrl && !isValidUrl(formData.jiraUrl)) {
+      errors.jiraUrl = 'Please enter a valid URL';
     }
 
-    if (!formData.projectKey.trim()) {
-      errors.projectKey = 'Project Key is required';
-    } else if (!/^[A-Z][A-Z0-9]*$/i.test(formData.projectKey)) {
+    if (!errors.projectKey && !isValidProjectKey(formData.projectKey)) {
       errors.projectKey = 'Project Key should contain only letters and numbers';
     }
 
@@ -88,8 +117,8 @@ const ConfigurationForm = ({
         errors.endDate = 'End date must be after start date';
       }
 
-      const daysDifference = (endDate - startDate) / (1000 * 60 * 60 * 24);
-      if (daysDifference > 365) {
+      const daysDifference = (endDate - startDate) / MS_PER_DAY;
+      if (daysDifference > MAX_RANGE_DAYS) {
         errors.endDate = 'Date range cannot exceed 1 year';
       }
     }
@@ -98,19 +127,6 @@ const ConfigurationForm = ({
     return Object.keys(errors).length === 0;
   };
 
-  /**
-   * Simple URL validation
-   */
-  const isValidUrl = (url) => {
-    try {
-      const urlToTest = url.startsWith('http') ? url : `https://${url}`;
-      new URL(urlToTest);
-      return true;
-    } catch {
-      return false;
-    }
-  };
-
   /**
    * Handle form submission and API call
    */
@@ -132,11 +148,7 @@ const ConfigurationForm = ({
         end_date: formData.endDate
       };
 
-      const response = await axios.get(getApiUrl('/api/jira/report'), {
-        params,
-        timeout: 120000,
-        headers: { 'Content-Type': 'application/json' }
-      });
+      const response = await apiClient.get('/api/jira/report', { params });
 
       onReportSuccess(response.data);
 
@@ -201,84 +213,33 @@ const ConfigurationForm = ({
 
       <div className="card-body">
         <form onSubmit={handleSubmit} className="space-y-6">
-          {/* Jira URL */}
-          <div>
-            <label htmlFor="jiraUrl" className="form-label">
-              Jira URL *
-            </label>
-            <input
-              type="text"
-              id="jiraUrl"
-              name="jiraUrl"
-              value={formData.jiraUrl}
-              onChange={handleInputChange}
-              placeholder="https://your-company.atlassian.net"
-              disabled={isLoading}
-              className={`form-input ${validationErrors.jiraUrl ? 'border-red-300 focus:border-red-500 focus:ring-red-500' : ''}`}
-            />
-            {validationErrors.jiraUrl && (
-              <div className="form-error">
-                <span className="error-icon">⚠️</span>
-                {validationErrors.jiraUrl}
-              </div>
-            )}
-            <p className="mt-1 text-xs text-gray-500">
-              Your Jira instance URL (e.g., https://company.atlassian.net)
-            </p>
-          </div>
-
-          {/* Personal Access Token */}
-          <div>
-            <label htmlFor="personalAccessToken" className="form-label">
-              Personal Access Token *
-            </label>
-            <input
-              type="password"
-              id="personalAccessToken"
-              name="personalAccessToken"
-              value={formData.personalAccessToken}
-              onChange={handleInputChange}
-              placeholder="Your Jira API token"
-              disabled={isLoading}
-              className={`form-input ${validationErrors.personalAccessToken ? 'border-red-300 focus:border-red-500 focus:ring-red-500' : ''}`}
-            />
-            {validationErrors.personalAccessToken && (
-              <div className="form-error">
-                <span className="error-icon">⚠️</span>
-                {validationErrors.personalAccessToken}
-              </div>
-            )}
-            <p className="mt-1 text-xs text-gray-500">
-              Generate in Jira: Profile → Security → API tokens
-            </p>
-          </div>
-
-          {/* Project Key */}
-          <div>
-            <label htmlFor="projectKey" className="form-label">
-              Project Key *
-            </label>
-            <input
-              type="text"
-              id="projectKey"
-              name="projectKey"
-              value={formData.projectKey}
-              onChange={handleInputChange}
-              placeholder="PROJ"
-              disabled={isLoading}
-              className={`form-input ${validationErrors.projectKey ? 'border-red-300 focus:border-red-500 focus:ring-red-500' : ''}`}
-              style={{ textTransform: 'uppercase' }}
-            />
-            {validationErrors.projectKey && (
-              <div className="form-error">
-                <span className="error-icon">⚠️</span>
-                {validationErrors.projectKey}
-              </div>
-            )}
-            <p className="mt-1 text-xs text-gray-500">
-              Found in project settings or issue URLs (e.g., PROJ in PROJ-123)
-            </p>
-          </div>
+          {TEXT_FIELDS.map(field => (
+            <div key={field.id}>
+              <label htmlFor={field.id} className="form-label">
+                {field.label} *
+              </label>
+              <input
+                type={field.type}
+                id={field.id}
+                name={field.id}
+                value={formData[field.id]}
+                onChange={handleInputChange}
+                placeholder={field.placeholder}
+                disabled={isLoading}
+                className={`form-input ${validationErrors[field.id] ? ERROR_INPUT_CLASS : ''}`}
+                style={field.style}
+              />
+              {validationErrors[field.id] && (
+                <div className="form-error">
+                  <span className="error-icon">⚠️</span>
+                  {validationErrors[field.id]}
+                </div>
+              )}
+              <p className="mt-1 text-xs text-gray-500">
+                {field.hint}
+              </p>
+            </div>
+          ))}
 
           {/* Date Range */}
           <div>
@@ -295,7 +256,7 @@ const ConfigurationForm = ({
                   value={formData.startDate}
                   onChange={handleInputChange}
                   disabled={isLoading}
-                  className={`form-input ${validationErrors.startDate ? 'border-red-300 focus:border-red-500 focus:ring-red-500' : ''}`}
+                  className={`form-input ${validationErrors.startDate ? ERROR_INPUT_CLASS : ''}`}
                 />
                 {validationErrors.startDate && (
                   <div className="form-error">
@@ -315,7 +276,7 @@ const ConfigurationForm = ({
                   value={formData.endDate}
                   onChange={handleInputChange}
                   disabled={isLoading}
-                  className={`form-input ${validationErrors.endDate ? 'border-red-300 focus:border-red-500 focus:ring-red-500' : ''}`}
+                  className={`form-input ${validationErrors.endDate ? ERROR_INPUT_CLASS : ''}`}
                 />
                 {validationErrors.endDate && (
                   <div className="form-error">
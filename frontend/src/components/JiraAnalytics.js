@@ -2,6 +2,23 @@ import React, { useMemo } from 'react';
 import { PieChart, Pie, Cell, BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip } from 'recharts';
 import { parseISO, differenceInDays } from 'date-fns';
 
+// Keyword matcher compiled once; the i flag avoids lowercasing every
+// summary, description and comment body before matching
+const BLOCKED_PATTERN = /blocked|stuck|waiting|dependency/i;
+
+// Color schemes for charts
+const STATUS_COLORS = {
+  'To Do': '#6b7280',
+  'Open': '#6b7280',
+  'In Progress': '#3b82f6',
+  'In Review': '#8b5cf6',
+  'Done': '#10b981',
+  'Closed': '#10b981',
+  'Resolved': '#10b981',
+  'Blocked': '#ef4444',
+  'default': '#f59e0b'
+};
+
 const JiraAnalytics = ({ data }) => {
   // Calculate analytics data
   const analytics = useMemo(() => {
@@ -18,10 +35,6 @@ const JiraAnalytics = ({ data }) => {
       };
     }
 
-    // Debug logging to understand the data structure
-    console.log('Analytics data sample:', data.slice(0, 2));
-    console.log('Total issues for analytics:', data.length);
-
     // Status distribution - always show data, don't filter out
     const statusCounts = {};
     
@@ -38,8 +51,6 @@ const JiraAnalytics = ({ data }) => {
         percentage: ((count / data.length) * 100).toFixed(1)
       }));
 
-    console.log('Status distribution:', statusDistribution);
-
     // Issue type distribution - always show data, don't filter out
     const typeCounts = {};
     
@@ -54,8 +65,6 @@ const JiraAnalytics = ({ data }) => {
         value: count
       }));
 
-    console.log('Issue type distribution:', issueTypeDistribution);
-
     // Priority distribution (handle priorities better)
     const priorityCounts = {};
     let hasValidPriorities = false;
@@ -84,8 +93,6 @@ const JiraAnalytics = ({ data }) => {
         value: count
       }));
 
-    console.log('Priority distribution:', priorityDistribution);
-
     // Find stalled issues (in progress for more than 7 days)
     const now = new Date();
     const stalledIssues = data.filter(issue => {
@@ -101,15 +108,14 @@ const JiraAnalytics = ({ data }) => {
     });
 
     // Find potentially blocked issues
-    const blockedKeywords = ['blocked', 'stuck', 'waiting', 'blocked on', 'dependency'];
     const blockedIssues = data.filter(issue => {
       const searchText = [
         issue.summary || '',
         issue.description || '',
         ...(issue.comments || []).map(c => c.body || '')
-      ].join(' ').toLowerCase();
+      ].join(' ');
       
-      return blockedKeywords.some(keyword => searchText.includes(keyword));
+      return BLOCKED_PATTERN.test(searchText);
     });
 
     // Recent activity (last 3 days)
@@ -126,7 +132,7 @@ const JiraAnalytics = ({ data }) => {
       }
     });
 
-    const result = {
+    return {
       statusDistribution,
       issueTypeDistribution,
       priorityDistribution,
@@ -135,35 +141,10 @@ const JiraAnalytics = ({ data }) => {
       recentActivity,
       totalIssues: data.length
     };
-
-    console.log('Analytics result summary:', {
-      statusCount: statusDistribution.length,
-      typeCount: issueTypeDistribution.length,
-      priorityCount: priorityDistribution.length,
-      stalledCount: stalledIssues.length,
-      blockedCount: blockedIssues.length,
-      recentCount: recentActivity.length,
-      totalIssues: data.length
-    });
-
-    return result;
   }, [data]);
 
-  // Color schemes for charts
-  const statusColors = {
-    'To Do': '#6b7280',
-    'Open': '#6b7280',
-    'In Progress': '#3b82f6',
-    'In Review': '#8b5cf6',
-    'Done': '#10b981',
-    'Closed': '#10b981',
-    'Resolved': '#10b981',
-    'Blocked': '#ef4444',
-    'default': '#f59e0b'
-  };
-
   const getStatusColor = (status) => {
-    return statusColors[status] || statusColors.default;
+    return STATUS_COLORS[status] || STATUS_COLORS.default;
   };
 
 
@@ -392,4 +373,4 @@ const JiraAnalytics = ({ data }) => {
   );
 };
 
-export default JiraAnalytics;
+export default React.memo(JiraAnalytics);
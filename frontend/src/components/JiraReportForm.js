@@ -1,7 +1,7 @@
 import React, { useState } from 'react';
-import axios from 'axios';
 import { format } from 'date-fns';
-import { getApiUrl } from '../config';
+import { apiClient } from '../config';
+import { isValidUrl, isValidProjectKey, MAX_RANGE_DAYS, MS_PER_DAY } from '../validation';
 
 /**
  * JiraReportForm Component
@@ -63,7 +63,7 @@ const JiraReportForm = ({ onReportSuccess, onReportError, onLoadingChange, isLoa
 
     if (!formData.projectKey.trim()) {
       errors.projectKey = 'Project Key is required';
-    } else if (!/^[A-Z][A-Z0-9]*$/.test(formData.projectKey.toUpperCase())) {
+    } else if (!isValidProjectKey(formData.projectKey)) {
       errors.projectKey = 'Project Key should contain only letters and numbers, starting with a letter';
     }
 
@@ -85,8 +85,8 @@ const JiraReportForm = ({ onReportSuccess, onReportError, onLoadingChange, isLoa
       }
 
       // Check if date range is too large (more than 1 year)
-      const daysDifference = (endDate - startDate) / (1000 * 60 * 60 * 24);
-      if (daysDifference > 365) {
+      const daysDifference = (endDate - startDate) / MS_PER_DAY;
+      if (daysDifference > MAX_RANGE_DAYS) {
         errors.endDate = 'Date range cannot exceed 1 year';
       }
     }
@@ -95,22 +95,6 @@ const JiraReportForm = ({ onReportSuccess, onReportError, onLoadingChange, isLoa
     return Object.keys(errors).length === 0;
   };
 
-  /**
-   * Simple URL validation
-   * @param {string} url - URL to validate
-   * @returns {boolean} - Whether the URL is valid
-   */
-  const isValidUrl = (url) => {
-    try {
-      // Add protocol if missing
-      const urlToTest = url.startsWith('http') ? url : `https://${url}`;
-      new URL(urlToTest);
-      return true;
-    } catch {
-      return false;
-    }
-  };
-
   /**
    * Handle form submission
    * @param {Event} e - Form submit event
@@ -139,13 +123,8 @@ const JiraReportForm = ({ onReportSuccess, onReportError, onLoadingChange, isLoa
       console.log('Sending API request with parameters:', { ...params, personal_access_token: '***' });
 
       // Make API call to backend
-      const response = await axios.get(getApiUrl('/api/jira/report'), {
-        params,
-        timeout: 120000, // 2 minute timeout for large datasets
-        headers: {
-          'Content-Type': 'application/json'
-        }
-      });
+      // Timeout comes from config.REQUEST_TIMEOUT (2 minutes for large datasets)
+      const response = await apiClient.get('/api/jira/report', { params });
 
       console.log(`Successfully retrieved ${response.data.length} issues`);
 
@@ -1,42 +1,38 @@
 import React, { useState, useMemo } from 'react';
 import { format, parseISO } from 'date-fns';
 import JiraCardDetailsModal from './JiraCardDetailsModal';
+import { getIssueSearchText } from '../searchText';
+import { compareJiraKeys } from '../jiraKeys';
 
-/**
- * Helper function to properly sort Jira keys (e.g., PROJECT-123)
- * Sorts by project name first, then by numeric ID
- */
-const parseJiraKey = (key) => {
-  if (!key) return { project: '', id: 0 };
-  
-  const match = key.match(/^([A-Za-z0-9]+)-(\d+)$/);
-  if (match) {
-    return {
-      project: match[1].toUpperCase(),
-      id: parseInt(match[2], 10)
-    };
-  }
-  
-  // Fallback for non-standard keys
-  return { project: key, id: 0 };
-};
+// Formatted dates keyed by the raw Jira timestamp; paging, sorting and
+// expanding rows re-render the same dates, so each is parsed only once
+const formattedDates = new Map();
+const MAX_FORMATTED_DATES = 5000;
 
 /**
- * Compare two Jira keys for sorting
+ * Format a Jira timestamp for display
  */
-const compareJiraKeys = (keyA, keyB) => {
-  const parsedA = parseJiraKey(keyA);
-  const parsedB = parseJiraKey(keyB);
-  
-  // First sort by project name
-  if (parsedA.project !== parsedB.project) {
-    return parsedA.project.localeCompare(parsedB.project);
+const formatDate = (dateString) => {
+  if (!dateString) return 'N/A';
+  let formatted = formattedDates.get(dateString);
+  if (formatted === undefined) {
+    try {
+      formatted = format(parseISO(dateString), 'MMM dd, yyyy HH:mm');
+    } catch {
+      formatted = dateString;
+    }
+    if (formattedDates.size >= MAX_FORMATTED_DATES) formattedDates.clear();
+    formattedDates.set(dateString, formatted);
   }
-  
-  // Then sort by numeric ID
-  return parsedA.id - parsedB.id;
+  return formatted;
 };
 
+// Page sizes offered by the pagination selector
+const PAGE_SIZES = [5, 10, 25, 50];
+
+// Header row of the CSV export
+const CSV_HEADER = ['Key', 'Summary', 'Status', 'Type', 'Priority', 'Assignee', 'Reporter', 'Created', 'Updated', 'Latest Activity'].join(',');
+
 /**
  * JiraReportsTable Component
  * 
@@ -62,11 +58,11 @@ const JiraReportsTable = ({ data, onClear, projectKey, dateRange }) => {
 
   // Filter and sort data
   const filteredAndSortedData = useMemo(() => {
+    // Lowercase the search term once rather than once per issue
+    const searchText = searchTerm.toLowerCase();
     let filtered = data.filter(issue => {
-      const matchesSearch = !searchTerm || 
-        issue.key?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        issue.summary?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        issue.description?.toLowerCase().includes(searchTerm.toLowerCase());
+      const matchesSearch = !searchText || 
+        getIssueSearchText(issue).includes(searchText);
 
       const matchesStatus = statusFilter === 'all' || issue.status?.name === statusFilter;
 
@@ -133,16 +129,6 @@ const JiraReportsTable = ({ data, onClear, projectKey, dateRange }) => {
     setCurrentPage(1);
   };
 
-  // Format date for display
-  const formatDate = (dateString) => {
-    if (!dateString) return 'N/A';
-    try {
-      return format(parseISO(dateString), 'MMM dd, yyyy HH:mm');
-    } catch {
-      return dateString;
-    }
-  };
-
   // Get status badge class
   const getStatusBadgeClass = (status) => {
     if (!status) return 'status-badge status-todo';
@@ -199,23 +185,25 @@ const JiraReportsTable = ({ data, onClear, projectKey, dateRange }) => {
 
   // Download as CSV
   const downloadCSV = () => {
-    const headers = ['Key', 'Summary', 'Status', 'Type', 'Priority', 'Assignee', 'Reporter', 'Created', 'Updated', 'Latest Activity'];
-    
-    const csvData = filteredAndSortedData.map(issue => [
-      issue.key || '',
-      `"${(issue.summary || '').replace(/"/g, '""')}"`,
-      issue.status?.name || '',
-      (issue.issue_type?.name && issue.issue_type.name !== 'Unknown') ? issue.issue_type.name : '',
-      issue.priority?.name || '',
-      issue.assignee?.display_name || '',
-      issue.reporter?.display_name || '',
-      issue.created || '',
-      issue.updated || '',
-      issue.latest_activity || issue.updated || ''
-    ]);
-
-    const csvContent = [headers, ...csvData].map(row => row.join(',')).join('\n');
-    const dataBlob = new Blob([csvContent], { type: 'text/csv' });
+    // Hand the Blob one line per row instead of spreading every row into a
+    // second array and joining the whole file into one large string first
+    const csvLines = [CSV_HEADER];
+    filteredAndSortedData.forEach(issue => {
+      csvLines.push('\n' + [
+        issue.key || '',
+        `"${(issue.summary || '').replace(/"/g, '""')}"`,
+        issue.status?.name || '',
+        (issue.issue_type?.name && issue.issue_type.name !== 'Unknown') ? issue.issue_type.name : '',
+        issue.priority?.name || '',
+        issue.assignee?.display_name || '',
+        issue.reporter?.display_name || '',
+        issue.created || '',
+        issue.updated || '',
+        issue.latest_activity || issue.updated || ''
+      ].join(','));
+    });
+
+    const dataBlob = new Blob(csvLines, { type: 'text/csv' });
     const url = URL.createObjectURL(dataBlob);
     const link = document.createElement('a');
     link.href = url;
@@ -326,10 +314,9 @@ const JiraReportsTable = ({ data, onClear, projectKey, dateRange }) => {
               }}
               className="form-input"
             >
-              <option value={5}>5 per page</option>
-              <option value={10}>10 per page</option>
-              <option value={25}>25 per page</option>
-              <option value={50}>50 per page</option>
+              {PAGE_SIZES.map(size => (
+                <option key={size} value={size}>{size} per page</option>
+              ))}
             </select>
           </div>
         </div>
@@ -582,4 +569,4 @@ const JiraReportsTable = ({ data, onClear, projectKey, dateRange }) => {
   );
 };
 
-export default JiraReportsTable;
+export default React.memo(JiraReportsTable);
@@ -1,40 +1,16 @@
 import React, { useState, useMemo } from 'react';
 import { format, parseISO } from 'date-fns';
+import { getIssueSearchText } from '../searchText';
+import { compareJiraKeys } from '../jiraKeys';
 
-/**
- * Helper function to properly sort Jira keys (e.g., PROJECT-123)
- * Sorts by project name first, then by numeric ID
- */
-const parseJiraKey = (key) => {
-  if (!key) return { project: '', id: 0 };
-  
-  const match = key.match(/^([A-Za-z0-9]+)-(\d+)$/);
-  if (match) {
-    return {
-      project: match[1].toUpperCase(),
-      id: parseInt(match[2], 10)
-    };
-  }
-  
-  // Fallback for non-standard keys
-  return { project: key, id: 0 };
-};
-
-/**
- * Compare two Jira keys for sorting
- */
-const compareJiraKeys = (keyA, keyB) => {
-  const parsedA = parseJiraKey(keyA);
-  const parsedB = parseJiraKey(keyB);
-  
-  // First sort by project name
-  if (parsedA.project !== parsedB.project) {
-    return parsedA.project.localeCompare(parsedB.project);
-  }
-  
-  // Then sort by numeric ID
-  return parsedA.id - parsedB.id;
-};
+// Fields offered by the sort selector
+const SORT_OPTIONS = [
+  { value: 'updated', label: 'Updated' },
+  { value: 'created', label: 'Created' },
+  { value: 'key', label: 'Key' },
+  { value: 'summary', label: 'Summary' },
+  { value: 'status', label: 'Status' }
+];
 
 /**
  * JiraResults Component
@@ -62,13 +38,11 @@ const JiraResults = ({ data, onClear }) => {
    * Filter and sort the issues based on current filters
    */
   const filteredAndSortedData = useMemo(() => {
+    // Text filter (search in key, summary, description), lowercased once
+    const searchText = filter.toLowerCase();
     let filtered = data.filter(issue => {
-      // Text filter (search in key, summary, description)
-      const searchText = filter.toLowerCase();
       const matchesText = !searchText || 
-        issue.key?.toLowerCase().includes(searchText) ||
-        issue.summary?.toLowerCase().includes(searchText) ||
-        issue.description?.toLowerCase().includes(searchText);
+        getIssueSearchText(issue).includes(searchText);
 
       // Status filter
       const matchesStatus = statusFilter === 'all' || issue.status?.name === statusFilter;
@@ -242,11 +216,9 @@ const JiraResults = ({ data, onClear }) => {
                 fontSize: '0.9rem'
               }}
             >
-              <option value="updated">Updated</option>
-              <option value="created">Created</option>
-              <option value="key">Key</option>
-              <option value="summary">Summary</option>
-              <option value="status">Status</option>
+              {SORT_OPTIONS.map(({ value, label }) => (
+                <option key={value} value={value}>{label}</option>
+              ))}
             </select>
             <button
               onClick={() => setSortOrder(sortOrder === 'asc' ? 'desc' : 'asc')}
@@ -1,5 +1,13 @@
 import React, { useEffect } from 'react';
 
+const SIZE_CLASSES = {
+  sm: 'max-w-md',
+  md: 'max-w-lg',
+  lg: 'max-w-2xl',
+  xl: 'max-w-4xl',
+  '2xl': 'max-w-6xl'
+};
+
 const Modal = ({ isOpen, onClose, title, children, size = 'lg' }) => {
   // Close modal on Escape key
   useEffect(() => {
@@ -23,14 +31,6 @@ const Modal = ({ isOpen, onClose, title, children, size = 'lg' }) => {
 
   if (!isOpen) return null;
 
-  const sizeClasses = {
-    sm: 'max-w-md',
-    md: 'max-w-lg',
-    lg: 'max-w-2xl',
-    xl: 'max-w-4xl',
-    '2xl': 'max-w-6xl'
-  };
-
   return (
     <div className="fixed inset-0 z-50 overflow-y-auto">
       {/* Backdrop */}
@@ -42,7 +42,7 @@ const Modal = ({ isOpen, onClose, title, children, size = 'lg' }) => {
       {/* Modal */}
       <div className="flex min-h-full items-center justify-center p-4">
         <div 
-          className={`relative w-full ${sizeClasses[size]} bg-white rounded-lg shadow-xl transform transition-all`}
+          className={`relative w-full ${SIZE_CLASSES[size]} bg-white rounded-lg shadow-xl transform transition-all`}
           onClick={(e) => e.stopPropagation()}
         >
           {/* Header */}
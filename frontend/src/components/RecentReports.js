@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useMemo, useState } from 'react';
 import { format, parseISO } from 'date-fns';
 
 /**
@@ -10,16 +10,19 @@ const RecentReports = ({ reports, onLoadReport, onDeleteReport }) => {
   const [sortBy, setSortBy] = useState('date'); // 'date', 'project'
   const [sortOrder, setSortOrder] = useState('desc'); // 'asc', 'desc'
 
-  // Sort reports based on current sort settings
-  const sortedReports = [...reports].sort((a, b) => {
+  // Sort reports based on current sort settings; memoized so re-renders that
+  // don't change the list or sort settings skip the copy and sort
+  const sortedReports = useMemo(() => [...reports].sort((a, b) => {
     let aVal, bVal;
 
     if (sortBy === 'project') {
       aVal = a.projectKey.toLowerCase();
       bVal = b.projectKey.toLowerCase();
     } else {
-      aVal = new Date(a.generatedAt);
-      bVal = new Date(b.generatedAt);
+      // generatedAt comes from toISOString() (fixed-width UTC), so string
+      // order is chronological order; no Date objects per comparison
+      aVal = a.generatedAt;
+      bVal = b.generatedAt;
     }
 
     if (sortOrder === 'asc') {
@@ -27,7 +30,7 @@ const RecentReports = ({ reports, onLoadReport, onDeleteReport }) => {
     } else {
       return aVal < bVal ? 1 : aVal > bVal ? -1 : 0;
     }
-  });
+  }), [reports, sortBy, sortOrder]);
 
   // Handle sort change
   const handleSortChange = (newSortBy) => {
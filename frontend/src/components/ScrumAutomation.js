@@ -1,26 +1,41 @@
 import React, { useState, useMemo } from 'react';
 import { format, parseISO, differenceInDays } from 'date-fns';
 
-const ScrumAutomation = ({ data, projectKey, dateRange }) => {
-  const [activeTab, setActiveTab] = useState('summary');
-
-  // Helper function to generate markdown summary
-  const generateMarkdownSummary = (insights) => {
-    const {
-      projectKey,
-      dateRange,
-      totalIssues,
-      completedWork,
-      inProgressWork,
-      upcomingWork,
-      longRunningIssues,
-      blockedIssues,
-      riskyIssues
-    } = insights;
-
-    const today = format(new Date(), 'MMM dd, yyyy');
-
-    return `# Scrum Report - ${projectKey}
+// Keyword matchers compiled once; the i flag avoids lowercasing every
+// summary, description and comment body before matching
+const BLOCKED_PATTERN = /blocked|stuck|waiting|dependency|external/i;
+const RISK_PATTERN = /risk|problem|urgent|critical|escalate|help needed/i;
+
+const TABS = [
+  { id: 'summary', name: '📝 Report Summary', icon: '📝' },
+  { id: 'attention', name: '⚠️ Needs Attention', icon: '⚠️' },
+  { id: 'insights', name: '🧠 AI Insights', icon: '🧠' }
+];
+
+// Text searched for blocked/risk keywords
+const getIssueText = (issue) => [
+  issue.summary || '',
+  issue.description || '',
+  ...(issue.comments || []).map(c => c.body || '')
+].join(' ');
+
+// Build the Markdown report; pure, so it lives outside the component
+const generateMarkdownSummary = (insights) => {
+  const {
+    projectKey,
+    dateRange,
+    totalIssues,
+    completedWork,
+    inProgressWork,
+    upcomingWork,
+    longRunningIssues,
+    blockedIssues,
+    riskyIssues
+  } = insights;
+
+  const today = format(new Date(), 'MMM dd, yyyy');
+
+  return `# Scrum Report - ${projectKey}
 
 **Report Date:** ${today}  
 **Period:** ${dateRange}  
@@ -87,7 +102,10 @@ ${longRunningIssues.length > 0 ? '- **Review long-running issues** - Consider br
 
 ---
 *Generated automatically by Jira Status Automation*`;
-  };
+};
+
+const ScrumAutomation = ({ data, projectKey, dateRange }) => {
+  const [activeTab, setActiveTab] = useState('summary');
 
   // Generate automated insights
   const automatedInsights = useMemo(() => {
@@ -141,31 +159,18 @@ ${longRunningIssues.length > 0 ? '- **Review long-running issues** - Consider br
       }
     });
 
+    // Build each issue's searchable text once for both keyword scans
+    const issueTexts = data.map(getIssueText);
+
     // Find blocked issues
-    const blockedKeywords = ['blocked', 'stuck', 'waiting', 'blocked on', 'dependency', 'external'];
-    const blockedIssues = data.filter(issue => {
-      const searchText = [
-        issue.summary || '',
-        issue.description || '',
-        ...(issue.comments || []).map(c => c.body || '')
-      ].join(' ').toLowerCase();
-      
-      return blockedKeywords.some(keyword => searchText.includes(keyword));
-    });
+    const blockedIssues = data.filter((issue, index) => BLOCKED_PATTERN.test(issueTexts[index]));
 
     // Find risky issues
-    const riskKeywords = ['risk', 'problem', 'urgent', 'critical', 'escalate', 'help needed'];
-    const riskyIssues = data.filter(issue => {
-      const searchText = [
-        issue.summary || '',
-        issue.description || '',
-        ...(issue.comments || []).map(c => c.body || '')
-      ].join(' ').toLowerCase();
-      
-      return riskKeywords.some(keyword => searchText.includes(keyword)) ||
-             issue.priority?.name?.toLowerCase().includes('critical') ||
-             issue.priority?.name?.toLowerCase().includes('highest');
-    });
+    const riskyIssues = data.filter((issue, index) =>
+      RISK_PATTERN.test(issueTexts[index]) ||
+      issue.priority?.name?.toLowerCase().includes('critical') ||
+      issue.priority?.name?.toLowerCase().includes('highest')
+    );
 
     // Generate Markdown summary
     const markdownSummary = generateMarkdownSummary({
@@ -251,11 +256,7 @@ ${longRunningIssues.length > 0 ? '- **Review long-running issues** - Consider br
       {/* Tab Navigation */}
       <div className="border-b border-gray-200">
         <nav className="-mb-px flex space-x-8">
-          {[
-            { id: 'summary', name: '📝 Report Summary', icon: '📝' },
-            { id: 'attention', name: '⚠️ Needs Attention', icon: '⚠️' },
-            { id: 'insights', name: '🧠 AI Insights', icon: '🧠' }
-          ].map(tab => (
+          {TABS.map(tab => (
             <button
               key={tab.id}
               onClick={() => setActiveTab(tab.id)}
@@ -522,4 +523,4 @@ ${longRunningIssues.length > 0 ? '- **Review long-running issues** - Consider br
   );
 };
 
-export default ScrumAutomation;
+export default React.memo(ScrumAutomation);
@@ -3,6 +3,8 @@
  * Handles environment variables and default settings
  */
 
+import axios from 'axios';
+
 // Get the current frontend URL
 const getCurrentUrl = () => {
   if (typeof window !== 'undefined') {
@@ -30,17 +32,45 @@ const config = {
   IS_DEVELOPMENT: process.env.NODE_ENV === 'development',
 };
 
+// API base URL without a trailing slash, resolved once at load
+const API_BASE = config.API_BASE_URL.endsWith('/')
+  ? config.API_BASE_URL.slice(0, -1)
+  : config.API_BASE_URL;
+
+// The API runs on a different origin than the UI, so warm up the DNS, TCP
+// and TLS setup while the app boots instead of on the first report request.
+// Requests are sent without credentials, hence the anonymous CORS mode.
+if (typeof document !== 'undefined') {
+  try {
+    const apiOrigin = new URL(API_BASE).origin;
+    if (apiOrigin !== window.location.origin) {
+      const link = document.createElement('link');
+      link.rel = 'preconnect';
+      link.href = apiOrigin;
+      link.crossOrigin = 'anonymous';
+      document.head.appendChild(link);
+    }
+  } catch {
+    // Relative or malformed API URL; nothing to preconnect to
+  }
+}
+
 // Helper functions
 export const getApiUrl = (endpoint = '') => {
-  const baseUrl = config.API_BASE_URL.endsWith('/') 
-    ? config.API_BASE_URL.slice(0, -1) 
-    : config.API_BASE_URL;
-  
   const cleanEndpoint = endpoint.startsWith('/') ? endpoint : `/${endpoint}`;
   
-  return `${baseUrl}${cleanEndpoint}`;
+  return `${API_BASE}${cleanEndpoint}`;
 };
 
+// Shared HTTP client so every request reuses the same defaults and
+// keep-alive connection to the backend. GET requests carry no body, so no
+// Content-Type is set: that header would turn them into non-simple CORS
+// requests and cost an extra OPTIONS preflight round trip.
+export const apiClient = axios.create({
+  baseURL: API_BASE,
+  timeout: config.REQUEST_TIMEOUT,
+});
+
 export const getFrontendPort = () => {
   if (typeof window !== 'undefined') {
     return window.location.port || '80';
@@ -0,0 +1,47 @@
+/**
+ * Jira key helpers shared by the report tables
+ * Keys are parsed once and reused by every comparison, so sorting by key no
+ * longer runs the regex and parseInt twice per comparison
+ */
+
+const JIRA_KEY_PATTERN = /^([A-Za-z0-9]+)-(\d+)$/;
+
+// Parsed keys by raw key string; cleared if it ever grows unreasonably
+const parsedKeys = new Map();
+const MAX_PARSED_KEYS = 5000;
+
+/**
+ * Split a Jira key (e.g., PROJECT-123) into project and numeric ID
+ * @param {string} key - Issue key
+ * @returns {{project: string, id: number}} - Parsed key
+ */
+export const parseJiraKey = (key) => {
+  if (!key) return { project: '', id: 0 };
+
+  let parsed = parsedKeys.get(key);
+  if (parsed === undefined) {
+    const match = key.match(JIRA_KEY_PATTERN);
+    parsed = match
+      ? { project: match[1].toUpperCase(), id: parseInt(match[2], 10) }
+      // Fallback for non-standard keys
+      : { project: key, id: 0 };
+    if (parsedKeys.size >= MAX_PARSED_KEYS) parsedKeys.clear();
+    parsedKeys.set(key, parsed);
+  }
+  return parsed;
+};
+
+/**
+ * Compare two Jira keys for sorting
+ * Sorts by project name first, then by numeric ID
+ */
+export const compareJiraKeys = (keyA, keyB) => {
+  const parsedA = parseJiraKey(keyA);
+  const parsedB = parseJiraKey(keyB);
+
+  if (parsedA.project !== parsedB.project) {
+    return parsedA.project.localeCompare(parsedB.project);
+  }
+
+  return parsedA.id - parsedB.id;
+};
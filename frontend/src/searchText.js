@@ -0,0 +1,26 @@
+/**
+ * Issue search helpers shared by the report tables
+ * Lowercased search text is built once per issue object and reused on
+ * every keystroke instead of lowercasing key/summary/description each time
+ */
+
+// Keyed by issue object, so entries go away with the report data
+const searchTextCache = new WeakMap();
+
+/**
+ * Get the lowercased text searched by the table filters
+ * @param {Object} issue - Issue from the report data
+ * @returns {string} - Key, summary and description, lowercased
+ */
+export const getIssueSearchText = (issue) => {
+  let text = searchTextCache.get(issue);
+  if (text === undefined) {
+    // Newline separator keeps matches from spanning two fields
+    text = [issue.key, issue.summary, issue.description]
+      .filter(Boolean)
+      .join('\n')
+      .toLowerCase();
+    searchTextCache.set(issue, text);
+  }
+  return text;
+};
@@ -0,0 +1,30 @@
+/**
+ * Shared form validation helpers for Jira Status Automation
+ * Compiled once at module load and reused by every form
+ */
+
+// Project keys start with a letter followed by letters or digits
+export const PROJECT_KEY_PATTERN = /^[A-Z][A-Z0-9]*$/i;
+
+// Longest report range accepted by the forms
+export const MAX_RANGE_DAYS = 365;
+
+export const MS_PER_DAY = 1000 * 60 * 60 * 24;
+
+/**
+ * Simple URL validation
+ * @param {string} url - URL to validate, protocol optional
+ * @returns {boolean} - Whether the URL is valid
+ */
+export const isValidUrl = (url) => {
+  try {
+    // Add protocol if missing
+    const urlToTest = url.startsWith('http') ? url : `https://${url}`;
+    new URL(urlToTest);
+    return true;
+  } catch {
+    return false;
+  }
+};
+
+export const isValidProjectKey = (key) => PROJECT_KEY_PATTERN.test(key);
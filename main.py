@@ -5,25 +5,64 @@ Provides REST API endpoints for retrieving Jira issue reports
 
 from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
-from dateutil.parser import parse as parse_date
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse, Response, StreamingResponse
+from typing import Dict, Any, Iterator
+from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
 import logging
+import re
 import traceback
 from jira import JIRA
 from jira.exceptions import JIRAError
+from requests.exceptions import ConnectionError as RequestsConnectionError
 import json
 from config import Config
 
+# orjson serializes several times faster than the stdlib; keep json as a
+# fallback so the API still runs where the wheel is unavailable
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+except ImportError:
+    orjson = None
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, default=str).encode()
+
 # Configure logging
 logging.basicConfig(level=getattr(logging, Config.LOG_LEVEL))
 logger = logging.getLogger(__name__)
 
+# Query-string token values as they appear in request paths
+TOKEN_QUERY_PATTERN = re.compile(r'(personal_access_token=)[^&\s]*')
+
+
+class RedactTokenFilter(logging.Filter):
+    """Mask personal access tokens in uvicorn access log lines"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        # uvicorn.access records carry the request path as the third argument
+        args = record.args
+        if isinstance(args, tuple) and len(args) >= 3 and isinstance(args[2], str) \
+                and 'personal_access_token=' in args[2]:
+            record.args = args[:2] + (TOKEN_QUERY_PATTERN.sub(r'\1***', args[2]),) + args[3:]
+        return True
+
+
+logging.getLogger("uvicorn.access").addFilter(RedactTokenFilter())
+
 # Initialize FastAPI app
 app = FastAPI(
     title=Config.API_TITLE,
     description=Config.API_DESCRIPTION,
-    version=Config.API_VERSION
+    version=Config.API_VERSION,
+    # Serialize JSON responses with orjson when it is installed
+    default_response_class=ORJSONResponse if orjson else JSONResponse
 )
 
 # Add CORS middleware to allow frontend connections
@@ -35,6 +74,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress responses for clients that accept gzip; report JSON is highly
+# repetitive and typically shrinks several-fold on the wire
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=Config.GZIP_MIN_SIZE,
+    compresslevel=Config.GZIP_LEVEL,
+)
+
+
+# Issue fields read by extract_issue_details; requesting only these keeps the
+# search payload (and the JSON parsed for it) much smaller than the "*all" default
+REPORT_FIELDS = [
+    "summary", "description", "issuetype", "status", "priority",
+    "reporter", "assignee", "created", "updated", "resolutiondate",
+    "resolution", "labels", "components", "fixVersions", "timetracking",
+    "comment",
+]
+
 
 def validate_date_format(date_string: str) -> datetime:
     """
@@ -49,12 +106,53 @@ def validate_date_format(date_string: str) -> datetime:
     Raises:
         ValueError: If date format is invalid
     """
+    # datetime.fromisoformat is implemented in C, unlike strptime which goes
+    # through the regex-based _strptime module; the shape check keeps the
+    # accepted input strictly YYYY-MM-DD (fromisoformat also allows YYYYMMDD)
+    if len(date_string) != 10 or date_string[4] != '-' or date_string[7] != '-':
+        raise ValueError(f"Invalid date format: {date_string}. Expected YYYY-MM-DD format.")
     try:
-        return datetime.strptime(date_string, "%Y-%m-%d")
+        return datetime.fromisoformat(date_string)
     except ValueError:
         raise ValueError(f"Invalid date format: {date_string}. Expected YYYY-MM-DD format.")
 
 
+@lru_cache(maxsize=8)
+def _connect_jira(jira_url: str, personal_access_token: str) -> JIRA:
+    """
+    Open and verify a Jira connection, cached per (url, token)
+    
+    Building a client costs a serverInfo round trip plus the auth handshake, so
+    repeat reports for the same instance and token reuse the authenticated
+    client and its pooled session. Failures raise and are therefore never cached.
+    """
+    # Create Jira client with token-based authentication
+    # Personal Access Token authentication uses the token as both username and password
+    jira_client = JIRA(
+        server=jira_url,
+        token_auth=personal_access_token,
+        options={
+            'check_update': False,  # Skip version check for faster initialization
+            'agile_rest_path': 'agile'
+        },
+        # Separate (connect, read) budgets: dead hosts fail after a few
+        # seconds instead of consuming the whole read timeout
+        timeout=(Config.JIRA_CONNECT_TIMEOUT, Config.REQUEST_TIMEOUT),
+        # No retries for the serverInfo check made by the constructor: the
+        # session backs off 20-60s between attempts on connection errors, so
+        # an unreachable host would otherwise take minutes to report
+        max_retries=0
+    )
+    # Report calls against a host that did answer keep retrying on 429/503
+    jira_client._session.max_retries = Config.JIRA_MAX_RETRIES
+    
+    # The constructor already fetched serverInfo (get_server_info=True) and
+    # raises if it failed, so the connection is verified without a second call
+    logger.info(f"Successfully connected to Jira server: {jira_url} ({jira_client.deploymentType or 'Unknown'})")
+    
+    return jira_client
+
+
 def create_jira_client(jira_url: str, personal_access_token: str) -> JIRA:
     """
     Create authenticated Jira client using personal access token
@@ -74,22 +172,7 @@ def create_jira_client(jira_url: str, personal_access_token: str) -> JIRA:
         if not jira_url.startswith(('http://', 'https://')):
             jira_url = f"https://{jira_url}"
         
-        # Create Jira client with token-based authentication
-        # Personal Access Token authentication uses the token as both username and password
-        jira_client = JIRA(
-            server=jira_url,
-            token_auth=personal_access_token,
-            options={
-                'check_update': False,  # Skip version check for faster initialization
-                'agile_rest_path': 'agile'
-            }
-        )
-        
-        # Test the connection by getting server info
-        server_info = jira_client.server_info()
-        logger.info(f"Successfully connected to Jira server: {server_info.get('serverTitle', 'Unknown')}")
-        
-        return jira_client
+        return _connect_jira(jira_url, personal_access_token)
         
     except JIRAError as e:
         logger.error(f"Jira authentication/connection failed: {str(e)}")
@@ -97,6 +180,14 @@ def create_jira_client(jira_url: str, personal_access_token: str) -> JIRA:
             status_code=401,
             detail=f"Failed to authenticate with Jira: {str(e)}"
         )
+    except RequestsConnectionError as e:
+        # Unresolvable or unreachable host (connect timeouts included): almost
+        # always a wrong Jira URL rather than a server-side fault
+        logger.error(f"Could not reach Jira at {jira_url}: {str(e)}")
+        raise HTTPException(
+            status_code=404,
+            detail=f"Could not reach Jira at {jira_url}. Please check the Jira URL."
+        )
     except Exception as e:
         logger.error(f"Unexpected error creating Jira client: {str(e)}")
         raise HTTPException(
@@ -136,21 +227,76 @@ def build_jql_query(project_key: str, start_date: str, end_date: str) -> str:
     return jql_query
 
 
+# Sentinel distinguishing a missing attribute from one that is set to None
+_MISSING = object()
+
+
+@lru_cache(maxsize=None)
+def _split_attr_path(attr_path: str) -> tuple:
+    """Split a dotted attribute path once; the set of paths used is small and fixed"""
+    return tuple(attr_path.split('.'))
+
+
 def safe_get_attr(obj, attr_path, default=None):
     """Safely get nested attributes with fallback"""
     try:
-        attrs = attr_path.split('.')
         current = obj
-        for attr in attrs:
-            if hasattr(current, attr):
-                current = getattr(current, attr)
-            else:
+        for attr in _split_attr_path(attr_path):
+            # Single lookup per hop instead of hasattr() followed by getattr()
+            current = getattr(current, attr, _MISSING)
+            if current is _MISSING:
                 return default
         return current
     except (AttributeError, TypeError):
         return default
 
 
+def build_basic_issue_details(issue, error_key: str, error_message: str) -> Dict[str, Any]:
+    """
+    Build the reduced issue record returned when full extraction fails
+    
+    Args:
+        issue: Jira issue object
+        error_key: Key under which the failure message is reported
+        error_message: Description of what went wrong
+        
+    Returns:
+        Dictionary with the basic issue fields and the error message
+    """
+    return {
+        "key": safe_get_attr(issue, 'key', 'Unknown'),
+        "summary": safe_get_attr(issue, 'fields.summary', 'Unable to retrieve summary'),
+        "issue_type": {
+            "name": safe_get_attr(issue, 'fields.issuetype.name', 'Unknown'),
+            "id": safe_get_attr(issue, 'fields.issuetype.id', None)
+        },
+        "status": {
+            "name": safe_get_attr(issue, 'fields.status.name', 'Unknown'),
+            "id": safe_get_attr(issue, 'fields.status.id', None)
+        },
+        "priority": {
+            "name": safe_get_attr(issue, 'fields.priority.name', None),
+            "id": safe_get_attr(issue, 'fields.priority.id', None)
+        } if safe_get_attr(issue, 'fields.priority', None) else None,
+        "assignee": {
+            "display_name": safe_get_attr(issue, 'fields.assignee.displayName', None),
+            "email": safe_get_attr(issue, 'fields.assignee.emailAddress', None)
+        } if safe_get_attr(issue, 'fields.assignee', None) else None,
+        "reporter": {
+            "display_name": safe_get_attr(issue, 'fields.reporter.displayName', None),
+            "email": safe_get_attr(issue, 'fields.reporter.emailAddress', None)
+        } if safe_get_attr(issue, 'fields.reporter', None) else None,
+        "created": safe_get_attr(issue, 'fields.created', None),
+        "updated": safe_get_attr(issue, 'fields.updated', None),
+        "latest_activity": safe_get_attr(issue, 'fields.updated', None),
+        "comments": [],
+        "changelog": [],
+        "labels": safe_get_attr(issue, 'fields.labels', []),
+        "description": safe_get_attr(issue, 'fields.description', None),
+        error_key: error_message
+    }
+
+
 def extract_issue_details(issue, jira_client: JIRA) -> Dict[str, Any]:
     """
     Extract comprehensive details from a Jira issue
@@ -170,7 +316,7 @@ def extract_issue_details(issue, jira_client: JIRA) -> Dict[str, Any]:
         Dictionary containing all issue details
     """
     try:
-        logger.debug(f"Extracting details for issue {issue.key}")
+        logger.debug("Extracting details for issue %s", issue.key)
         # Extract basic issue information with safe field access
         issue_data = {
             "key": safe_get_attr(issue, 'key', 'Unknown'),
@@ -231,9 +377,15 @@ def extract_issue_details(issue, jira_client: JIRA) -> Dict[str, Any]:
             }
         
         # Retrieve all comments with full content
-        # Comments are paginated, so we need to fetch all of them
+        # The search returns them inline in the "comment" field; that list can
+        # be capped by the server, so fall back to the paginated endpoint only
+        # when it does not hold every comment
         try:
-            comments = jira_client.comments(issue)
+            comment_field = safe_get_attr(issue, 'fields.comment', None)
+            if comment_field is not None and getattr(comment_field, 'total', 0) <= len(comment_field.comments):
+                comments = comment_field.comments
+            else:
+                comments = jira_client.comments(issue)
             issue_data["comments"] = []
             
             for comment in comments:
@@ -255,7 +407,7 @@ def extract_issue_details(issue, jira_client: JIRA) -> Dict[str, Any]:
                 }
                 issue_data["comments"].append(comment_data)
                 
-            logger.info(f"Retrieved {len(issue_data['comments'])} comments for issue {issue.key}")
+            logger.debug("Retrieved %d comments for issue %s", len(issue_data["comments"]), issue.key)
             
         except Exception as e:
             logger.warning(f"Failed to retrieve comments for issue {issue.key}: {str(e)}")
@@ -263,8 +415,12 @@ def extract_issue_details(issue, jira_client: JIRA) -> Dict[str, Any]:
         
         # Retrieve complete changelog to track all status changes and field updates
         try:
-            issue_with_changelog = jira_client.issue(issue.key, expand='changelog')
-            changelog = issue_with_changelog.changelog
+            # The search already ran with expand='changelog'; only refetch the
+            # issue when that copy is missing or was truncated by the server
+            changelog = getattr(issue, 'changelog', None)
+            if changelog is None or getattr(changelog, 'total', 0) > len(changelog.histories):
+                issue_with_changelog = jira_client.issue(issue.key, expand='changelog')
+                changelog = issue_with_changelog.changelog
             
             issue_data["changelog"] = []
             
@@ -295,7 +451,7 @@ def extract_issue_details(issue, jira_client: JIRA) -> Dict[str, Any]:
                 
                 issue_data["changelog"].append(history_entry)
             
-            logger.info(f"Retrieved {len(issue_data['changelog'])} changelog entries for issue {issue.key}")
+            logger.debug("Retrieved %d changelog entries for issue %s", len(issue_data["changelog"]), issue.key)
             
         except Exception as e:
             logger.warning(f"Failed to retrieve changelog for issue {issue.key}: {str(e)}")
@@ -325,7 +481,6 @@ def extract_issue_details(issue, jira_client: JIRA) -> Dict[str, Any]:
             issue_data["latest_activity"] = max(latest_timestamps)
         else:
             # Fallback to current timestamp if no activity found
-            from datetime import datetime
             issue_data["latest_activity"] = datetime.now().isoformat()
         
         return issue_data
@@ -333,54 +488,109 @@ def extract_issue_details(issue, jira_client: JIRA) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Error extracting details for issue {getattr(issue, 'key', 'Unknown')}: {str(e)}")
         logger.error(f"Exception type: {type(e).__name__}")
-        import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
         
         # Return basic information even if detailed extraction fails
-        return {
-            "key": safe_get_attr(issue, 'key', 'Unknown'),
-            "summary": safe_get_attr(issue, 'fields.summary', 'Unable to retrieve summary'),
-            "issue_type": {
-                "name": safe_get_attr(issue, 'fields.issuetype.name', 'Unknown'),
-                "id": safe_get_attr(issue, 'fields.issuetype.id', None)
-            },
-            "status": {
-                "name": safe_get_attr(issue, 'fields.status.name', 'Unknown'),
-                "id": safe_get_attr(issue, 'fields.status.id', None)
-            },
-            "priority": {
-                "name": safe_get_attr(issue, 'fields.priority.name', None),
-                "id": safe_get_attr(issue, 'fields.priority.id', None)
-            } if safe_get_attr(issue, 'fields.priority', None) else None,
-            "assignee": {
-                "display_name": safe_get_attr(issue, 'fields.assignee.displayName', None),
-                "email": safe_get_attr(issue, 'fields.assignee.emailAddress', None)
-            } if safe_get_attr(issue, 'fields.assignee', None) else None,
-            "created": safe_get_attr(issue, 'fields.created', None),
-            "updated": safe_get_attr(issue, 'fields.updated', None),
-            "latest_activity": safe_get_attr(issue, 'fields.updated', None),
-            "comments": [],
-            "changelog": [],
-            "labels": safe_get_attr(issue, 'fields.labels', []),
-            "description": safe_get_attr(issue, 'fields.description', None),
-            "error": f"Failed to extract full details: {str(e)}"
-        }
+        return build_basic_issue_details(issue, "error", f"Failed to extract full details: {str(e)}")
+
+
+def process_issue(issue, jira_client: JIRA) -> Dict[str, Any]:
+    """
+    Extract details for a single issue, falling back to basic fields on failure
+    
+    Args:
+        issue: Jira issue object
+        jira_client: Authenticated Jira client for additional API calls
+        
+    Returns:
+        Dictionary containing the issue details
+    """
+    try:
+        return extract_issue_details(issue, jira_client)
+        
+    except Exception as e:
+        logger.error(f"Failed to process issue {safe_get_attr(issue, 'key', 'Unknown')}: {str(e)}")
+        # Add fallback issue data with basic fields even if full processing fails
+        return build_basic_issue_details(issue, "processing_error", f"Detailed processing failed: {str(e)}")
+
+
+def stream_report(issues, jira_client: JIRA) -> Iterator[bytes]:
+    """
+    Serialize the report as a JSON array, one issue at a time
+    
+    Issues are processed and written out as they are extracted, so the client
+    starts receiving data before the whole report has been generated. Each
+    issue needs its own comments/changelog round trips, so up to
+    Config.REPORT_WORKERS issues are fetched in parallel; results are still
+    written in search order. At most twice that many issues are submitted
+    ahead of the consumer, so a slow reader holds a fixed number of finished
+    issue dicts in memory instead of the whole report. Each report gets its
+    own pool so a large or rate-limited report cannot queue ahead of other
+    users' reports.
+    
+    Args:
+        issues: Issues returned by the JQL search
+        jira_client: Authenticated Jira client for additional API calls
+        
+    Yields:
+        Consecutive chunks of the JSON array
+    """
+    window = 2 * Config.REPORT_WORKERS
+    remaining = iter(issues)
+    pending = deque()
+    
+    with ThreadPoolExecutor(max_workers=Config.REPORT_WORKERS, thread_name_prefix="report") as executor:
+        try:
+            for issue in remaining:
+                pending.append(executor.submit(process_issue, issue, jira_client))
+                if len(pending) >= window:
+                    break
+            
+            idx = 0
+            while pending:
+                issue_details = pending.popleft().result()
+                # Top the window back up before yielding so workers stay busy
+                # while this chunk is written out
+                for issue in remaining:
+                    pending.append(executor.submit(process_issue, issue, jira_client))
+                    break
+                
+                idx += 1
+                # Per-issue logging is debug-level with lazy %-formatting so the
+                # message is only built when debug output is actually enabled
+                logger.debug("Processed issue %d/%d: %s", idx, len(issues), issue_details.get("key"))
+                yield (b"[" if idx == 1 else b",") + _json_dumps(issue_details)
+        finally:
+            # Client went away mid-stream: drop work that has not started yet
+            # instead of fetching issues nobody will read
+            for future in pending:
+                future.cancel()
+    
+    yield b"]" if issues else b"[]"
+    logger.info(f"Successfully generated report with {len(issues)} issues")
+
+
+# The health payload never changes, so it is serialized once at import and
+# served as raw bytes instead of being validated and encoded on every poll
+HEALTH_RESPONSE_BODY = _json_dumps({"message": "Jira Status Automation API is running"})
 
 
 @app.get("/")
 async def root():
     """Health check endpoint"""
-    return {"message": "Jira Status Automation API is running"}
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 
+# Declared with plain def: the Jira client is blocking, so FastAPI runs this
+# in its threadpool instead of stalling the event loop for every other request
 @app.get("/api/jira/report")
-async def get_jira_report(
+def get_jira_report(
     jira_url: str = Query(..., description="Jira instance URL"),
     personal_access_token: str = Query(..., description="Jira personal access token"),
     project_key: str = Query(..., description="Jira project key"),
     start_date: str = Query(..., description="Start date in YYYY-MM-DD format"),
     end_date: str = Query(..., description="End date in YYYY-MM-DD format")
-) -> List[Dict[str, Any]]:
+) -> StreamingResponse:
     """
     Retrieve comprehensive Jira issue report for a project within a date range
     
@@ -388,7 +598,7 @@ async def get_jira_report(
     1. Authenticates to Jira using the provided personal access token
     2. Executes a JQL query to find all issues updated within the date range
     3. Retrieves complete details for each issue including comments and changelog
-    4. Returns structured JSON data with all issue information
+    4. Streams structured JSON data with all issue information
     
     Args:
         jira_url: Base URL of the Jira instance (e.g., "https://company.atlassian.net")
@@ -398,7 +608,7 @@ async def get_jira_report(
         end_date: End date for the search range (YYYY-MM-DD format)
         
     Returns:
-        List of dictionaries containing comprehensive issue details
+        Streamed JSON list of dictionaries containing comprehensive issue details
         
     Raises:
         HTTPException: For authentication failures, invalid parameters, or API errors
@@ -442,65 +652,34 @@ async def get_jira_report(
             issues = jira_client.search_issues(
                 jql_query,
                 maxResults=False,  # Get all results, not just first 50
+                fields=REPORT_FIELDS,  # Only the fields the report uses
                 expand='changelog'  # Include changelog data
             )
             logger.info(f"Found {len(issues)} issues matching the criteria")
             
         except JIRAError as e:
+            if e.status_code in (401, 403):
+                # The cached client outlived its token (revoked or expired);
+                # drop it so the next request authenticates from scratch and
+                # report it the way a failed fresh connection would be
+                _connect_jira.cache_clear()
+                logger.error(f"Jira rejected cached credentials: {str(e)}")
+                raise HTTPException(
+                    status_code=401,
+                    detail=f"Failed to authenticate with Jira: {str(e)}"
+                )
             logger.error(f"JQL search failed: {str(e)}")
             raise HTTPException(
                 status_code=400,
                 detail=f"JQL search failed: {str(e)}. Please check your project key and permissions."
             )
         
-        # Process each issue to extract comprehensive details
-        report_data = []
-        
-        for idx, issue in enumerate(issues, 1):
-            try:
-                logger.info(f"Processing issue {idx}/{len(issues)}: {issue.key}")
-                issue_details = extract_issue_details(issue, jira_client)
-                report_data.append(issue_details)
-                
-            except Exception as e:
-                logger.error(f"Failed to process issue {issue.key}: {str(e)}")
-                # Add fallback issue data with basic fields even if full processing fails
-                report_data.append({
-                    "key": issue.key,
-                    "summary": getattr(issue.fields, 'summary', 'Unable to retrieve summary'),
-                    "issue_type": {
-                        "name": getattr(issue.fields.issuetype, 'name', 'Unknown') if hasattr(issue.fields, 'issuetype') else 'Unknown',
-                        "id": getattr(issue.fields.issuetype, 'id', None) if hasattr(issue.fields, 'issuetype') else None
-                    },
-                    "status": {
-                        "name": getattr(issue.fields.status, 'name', 'Unknown') if hasattr(issue.fields, 'status') else 'Unknown',
-                        "id": getattr(issue.fields.status, 'id', None) if hasattr(issue.fields, 'status') else None
-                    },
-                    "priority": {
-                        "name": getattr(issue.fields.priority, 'name', None) if hasattr(issue.fields, 'priority') and issue.fields.priority else None,
-                        "id": getattr(issue.fields.priority, 'id', None) if hasattr(issue.fields, 'priority') and issue.fields.priority else None
-                    },
-                    "assignee": {
-                        "display_name": getattr(issue.fields.assignee, 'displayName', None) if hasattr(issue.fields, 'assignee') and issue.fields.assignee else None,
-                        "email": getattr(issue.fields.assignee, 'emailAddress', None) if hasattr(issue.fields, 'assignee') and issue.fields.assignee else None
-                    },
-                    "reporter": {
-                        "display_name": getattr(issue.fields.reporter, 'displayName', None) if hasattr(issue.fields, 'reporter') and issue.fields.reporter else None,
-                        "email": getattr(issue.fields.reporter, 'emailAddress', None) if hasattr(issue.fields, 'reporter') and issue.fields.reporter else None
-                    },
-                    "created": getattr(issue.fields, 'created', None),
-                    "updated": getattr(issue.fields, 'updated', None),
-                    "latest_activity": getattr(issue.fields, 'updated', None),
-                    "comments": [],
-                    "changelog": [],
-                    "labels": getattr(issue.fields, 'labels', []),
-                    "description": getattr(issue.fields, 'description', None),
-                    "processing_error": f"Detailed processing failed: {str(e)}"
-                })
-        
-        logger.info(f"Successfully generated report with {len(report_data)} issues")
-        
-        return report_data
+        # Stream the report back one issue at a time instead of buffering
+        # the whole list; per-issue failures are already handled inside
+        return StreamingResponse(
+            stream_report(issues, jira_client),
+            media_type="application/json"
+        )
         
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -4,7 +4,6 @@ Simple script to run the FastAPI server
 """
 
 import uvicorn
-from main import app
 from config import Config
 
 if __name__ == "__main__":
@@ -13,9 +12,11 @@ if __name__ == "__main__":
     print("Press Ctrl+C to stop the server")
     
     uvicorn.run(
-        app,
+        # Import string so uvicorn can load the app in each worker process
+        "main:app",
         host=Config.BACKEND_HOST,
         port=Config.BACKEND_PORT,
+        workers=Config.BACKEND_WORKERS,
         reload=False,  # Disable auto-reload for stability
         log_level=Config.LOG_LEVEL.lower()
     )
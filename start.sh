@@ -50,25 +50,67 @@ if [ ! -d "venv" ]; then
     python3 -m venv venv
 fi
 
-# Install Python dependencies
+# sha256 of stdin; stock macOS ships shasum rather than sha256sum. Prints
+# nothing if neither exists, and an empty hash never counts as up to date
+sha256_of() {
+    if command -v sha256sum &> /dev/null; then
+        sha256sum
+    elif command -v shasum &> /dev/null; then
+        shasum -a 256
+    fi | cut -d' ' -f1
+}
+
+# Dependency installs are independent, so pip and npm run concurrently and
+# the slower of the two sets the wait instead of their sum
+
+# Install Python dependencies (skipped when requirements.txt is unchanged)
 echo ""
-echo "📦 Installing Python dependencies..."
-if ! ./venv/bin/pip install -r requirements.txt; then
-    echo "❌ Failed to install Python dependencies"
-    echo "Try manually: ./venv/bin/pip install -r requirements.txt"
-    exit 1
+REQUIREMENTS_HASH=$(sha256_of < requirements.txt)
+REQUIREMENTS_SENTINEL="venv/.requirements.sha256"
+PIP_PID=""
+if [ -n "$REQUIREMENTS_HASH" ] && [ -f "$REQUIREMENTS_SENTINEL" ] && [ "$(cat "$REQUIREMENTS_SENTINEL")" = "$REQUIREMENTS_HASH" ]; then
+    echo "✅ Python dependencies already up to date"
+else
+    echo "📦 Installing Python dependencies..."
+    ./venv/bin/pip install -r requirements.txt &
+    PIP_PID=$!
 fi
 
-# Install frontend dependencies
-echo ""
-echo "📦 Installing frontend dependencies..."
-cd frontend
-if ! npm install; then
-    echo "❌ Failed to install frontend dependencies"
-    echo "Please check your Node.js installation and try again"
-    exit 1
+# Install frontend dependencies (skipped when package files are unchanged)
+packages_hash() {
+    cat frontend/package.json frontend/package-lock.json 2>/dev/null | sha256_of
+}
+PACKAGES_HASH=$(packages_hash)
+PACKAGES_SENTINEL="frontend/node_modules/.install.sha256"
+NPM_PID=""
+if [ -n "$PACKAGES_HASH" ] && [ -f "$PACKAGES_SENTINEL" ] && [ "$(cat "$PACKAGES_SENTINEL")" = "$PACKAGES_HASH" ]; then
+    echo "✅ Frontend dependencies already up to date"
+else
+    echo "📦 Installing frontend dependencies..."
+    (cd frontend && npm install) &
+    NPM_PID=$!
+fi
+
+if [ -n "$PIP_PID" ]; then
+    if ! wait $PIP_PID; then
+        echo "❌ Failed to install Python dependencies"
+        echo "Try manually: ./venv/bin/pip install -r requirements.txt"
+        [ -n "$NPM_PID" ] && wait $NPM_PID
+        exit 1
+    fi
+    echo "$REQUIREMENTS_HASH" > "$REQUIREMENTS_SENTINEL"
+fi
+
+if [ -n "$NPM_PID" ]; then
+    if ! wait $NPM_PID; then
+        echo "❌ Failed to install frontend dependencies"
+        echo "Please check your Node.js installation and try again"
+        exit 1
+    fi
+    # npm install may rewrite package-lock.json, so record the hash of the
+    # files as they are now, not as they were before the install
+    packages_hash > "$PACKAGES_SENTINEL"
 fi
-cd ..
 
 echo ""
 echo "✅ All dependencies installed successfully!"
@@ -15,11 +15,24 @@ BACKEND_PORT = os.getenv("BACKEND_PORT", "8000")
 BACKEND_HOST = os.getenv("BACKEND_HOST", "localhost")
 BASE_URL = f"http://{BACKEND_HOST}:{BACKEND_PORT}"
 
+# Endpoint URLs, built once
+HEALTH_URL = f"{BASE_URL}/"
+DOCS_URL = f"{BASE_URL}/docs"
+REDOC_URL = f"{BASE_URL}/redoc"
+REPORT_URL = f"{BASE_URL}/api/jira/report"
+
+# FAST=1 (or --fast) skips the slow network-bound checks
+FAST = os.getenv("FAST", "").lower() in ("1", "true", "yes") or "--fast" in sys.argv
+
+# One session for the whole suite so every request reuses the same
+# keep-alive connection instead of opening a new one per call
+SESSION = requests.Session()
+
 def test_health_check():
     """Test the root health check endpoint"""
     print("Testing health check endpoint...")
     try:
-        response = requests.get(f"{BASE_URL}/")
+        response = SESSION.get(HEALTH_URL)
         if response.status_code == 200:
             print("✓ Health check passed")
             return True
@@ -38,14 +51,14 @@ def test_api_documentation():
     print("Testing API documentation endpoints...")
     try:
         # Test Swagger UI
-        response = requests.get(f"{BASE_URL}/docs")
+        response = SESSION.get(DOCS_URL)
         if response.status_code == 200:
             print("✓ Swagger documentation available")
         else:
             print(f"✗ Swagger documentation failed: {response.status_code}")
         
         # Test ReDoc
-        response = requests.get(f"{BASE_URL}/redoc")
+        response = SESSION.get(REDOC_URL)
         if response.status_code == 200:
             print("✓ ReDoc documentation available")
         else:
@@ -61,7 +74,7 @@ def test_jira_endpoint_validation():
     print("Testing parameter validation...")
     
     # Test missing parameters
-    response = requests.get(f"{BASE_URL}/api/jira/report")
+    response = SESSION.get(REPORT_URL)
     if response.status_code == 422:  # Validation error
         print("✓ Missing parameters correctly rejected")
     else:
@@ -76,7 +89,7 @@ def test_jira_endpoint_validation():
         "end_date": "2024-01-31"
     }
     
-    response = requests.get(f"{BASE_URL}/api/jira/report", params=params)
+    response = SESSION.get(REPORT_URL, params=params)
     if response.status_code == 400:
         print("✓ Invalid date format correctly rejected")
     else:
@@ -91,7 +104,7 @@ def test_jira_endpoint_validation():
         "end_date": "2024-01-31"
     }
     
-    response = requests.get(f"{BASE_URL}/api/jira/report", params=params)
+    response = SESSION.get(REPORT_URL, params=params)
     if response.status_code == 400:
         print("✓ Invalid date range correctly rejected")
     else:
@@ -103,6 +116,11 @@ def test_jira_authentication_error():
     """Test that invalid Jira credentials are handled properly"""
     print("Testing Jira authentication error handling...")
     
+    if FAST:
+        # None marks the test as skipped rather than passed
+        print("- Skipped (FAST mode)")
+        return None
+    
     # Use invalid credentials that should fail authentication
     params = {
         "jira_url": "https://nonexistent-domain-test.atlassian.net",
@@ -113,7 +131,7 @@ def test_jira_authentication_error():
     }
     
     try:
-        response = requests.get(f"{BASE_URL}/api/jira/report", params=params, timeout=30)
+        response = SESSION.get(REPORT_URL, params=params, timeout=5)
         if response.status_code in [401, 403, 404]:
             print("✓ Invalid credentials correctly rejected")
             return True
@@ -142,18 +160,27 @@ def run_tests():
     ]
     
     passed = 0
-    total = len(tests)
+    skipped = 0
     
     for test_name, test_func in tests:
         print(f"\n--- {test_name} ---")
         try:
-            if test_func():
+            result = test_func()
+            if result is None:
+                skipped += 1
+            elif result:
                 passed += 1
+            elif test_func is test_health_check:
+                # Every other test needs a reachable server, so stop here
+                # instead of waiting on more connection errors
+                print("Skipping remaining tests: API server is not reachable")
+                break
         except Exception as e:
             print(f"✗ Test failed with exception: {e}")
     
     print("\n" + "=" * 60)
-    print(f"Test Results: {passed}/{total} tests passed")
+    total = len(tests) - skipped
+    print(f"Test Results: {passed}/{total} tests passed" + (f" ({skipped} skipped)" if skipped else ""))
     print("=" * 60)
     
     if passed == total: